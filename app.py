@@ -6,7 +6,6 @@ Professional-grade financial analysis and planning tool with unified design syst
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import sys
 import os
 import warnings
 import tracemalloc
@@ -21,9 +20,6 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 warnings.filterwarnings('ignore', category=UserWarning)
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 # Import core modules
 from src.data_processor import DataProcessor
 from src.visualizations import DashboardVisualizations
@@ -34,7 +30,7 @@ from src.components import (
 )
 from src.utils import ErrorHandler, CacheManager
 from config.settings import (
-    PAGE_CONFIG, PERSONA, TIMELINE_MILESTONES,
+    PAGE_CONFIG, PERSONA, TIMELINE_MILESTONES, DATA_PATHS,
     format_currency, format_percentage
 )
 from config.design_system import COLORS
@@ -60,9 +56,27 @@ def initialize_services():
         st.error(f"Failed to initialize services: {str(e)}")
         return None, None, None
 
-@st.cache_data
-def load_dashboard_data():
-    """Load and cache dashboard data with error handling"""
+
+def get_data_signature():
+    """Fingerprint the data files (path, mtime, size) to key the data cache"""
+    signature = []
+    for path in DATA_PATHS.values():
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+@st.cache_data(max_entries=1)
+def load_dashboard_data(data_signature=None):
+    """
+    Load and cache dashboard data with error handling
+    
+    Args:
+        data_signature: File fingerprint from get_data_signature; a changed
+            CSV yields a new key, so the data is re-parsed only then
+    """
     try:
         processor = DataProcessor()
         data = processor.load_data()
@@ -89,7 +103,7 @@ def main():
         
         # Load data with proper error handling
         try:
-            processor, data = load_dashboard_data()
+            processor, data = load_dashboard_data(get_data_signature())
         except Exception as e:
             error_handler.display_error("Data Loading Error", str(e))
             return
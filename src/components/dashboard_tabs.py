@@ -368,7 +368,11 @@ class OverviewTab(BaseTab):
             monthly_data = self.processor.get_monthly_summary()
             
             if not monthly_data.empty:
-                trend_chart = self.viz.create_monthly_trend_chart(monthly_data)
+                @st.cache_data(ttl=300)
+                def generate_trend_chart(monthly_data):
+                    return self.viz.create_monthly_trend_chart(monthly_data)
+                
+                trend_chart = generate_trend_chart(monthly_data)
                 st.plotly_chart(trend_chart, use_container_width=True, config={'displayModeBar': False}, key="overview_trend_chart")
             else:
                 st.info("No trend data available for analysis")
@@ -383,19 +387,29 @@ class OverviewTab(BaseTab):
         try:
             category_breakdown = self.processor.get_category_breakdown()
             
+            # Build all three charts once per distinct input; reruns reuse the cache
+            @st.cache_data(ttl=300)
+            def generate_category_charts(category_breakdown, expenses):
+                return (
+                    self.viz.create_category_breakdown_chart(category_breakdown),
+                    self.viz.create_category_comparison_chart(category_breakdown),
+                    self.viz.create_category_trend_chart(expenses)
+                )
+            
+            category_chart, comparison_chart, category_trend_chart = generate_category_charts(
+                category_breakdown, self.data['expenses']
+            )
+            
             # Two-column layout for distribution and comparison charts
             col1, col2 = st.columns(2)
             
             with col1:
-                category_chart = self.viz.create_category_breakdown_chart(category_breakdown)
                 st.plotly_chart(category_chart, use_container_width=True, config={'displayModeBar': False}, key="overview_category_chart")
             
             with col2:
-                comparison_chart = self.viz.create_category_comparison_chart(category_breakdown)
                 st.plotly_chart(comparison_chart, use_container_width=True, config={'displayModeBar': False}, key="overview_comparison_chart")
             
             # Full-width trend chart
-            category_trend_chart = self.viz.create_category_trend_chart(self.data['expenses'])
             st.plotly_chart(category_trend_chart, use_container_width=True, config={'displayModeBar': False}, key="overview_category_trend_chart")
         
         except Exception as e:
@@ -430,9 +444,7 @@ class ExpensesTab(BaseTab):
                 st.warning(f"{len(anomalies)} spending anomalies detected!")
                 
                 # Anomaly visualization
-                anomaly_chart = self.viz.create_anomaly_detection_chart(
-                    self.data['expenses'], anomalies
-                )
+                anomaly_chart = self._get_anomaly_chart(self.data['expenses'], anomalies)
                 st.plotly_chart(anomaly_chart, use_container_width=True, config={'displayModeBar': False}, key="expenses_anomaly_chart")
                 
                 # Anomaly details table
@@ -443,6 +455,14 @@ class ExpensesTab(BaseTab):
         except Exception as e:
             self.error_handler.display_error("Anomaly Detection Error", str(e))
     
+    def _get_anomaly_chart(self, expenses: pd.DataFrame, anomalies: pd.DataFrame) -> Any:
+        """Get anomaly detection chart with caching."""
+        @st.cache_data(ttl=300)
+        def generate_anomaly_chart(expenses, anomalies):
+            return self.viz.create_anomaly_detection_chart(expenses, anomalies)
+        
+        return generate_anomaly_chart(expenses, anomalies)
+    
     def _render_anomaly_details(self, anomalies: pd.DataFrame) -> None:
         """Render detailed anomaly information in a formatted table."""
         st.markdown("#### Anomaly Details")
@@ -639,7 +659,11 @@ class ExpensesTab(BaseTab):
         st.markdown("### City Cost Comparison")
         
         try:
-            city_chart = self.viz.create_city_comparison_chart(self.data['city_costs'])
+            @st.cache_data(ttl=300)
+            def generate_city_chart(city_costs):
+                return self.viz.create_city_comparison_chart(city_costs)
+            
+            city_chart = generate_city_chart(self.data['city_costs'])
             st.plotly_chart(city_chart, use_container_width=True, config={'displayModeBar': False}, key="expenses_city_chart")
         
         except Exception as e:
@@ -651,7 +675,12 @@ class ExpensesTab(BaseTab):
         
         try:
             expenses = self.data['expenses']
-            payment_pie = self.viz.create_payment_pie_chart(expenses)
+            
+            @st.cache_data(ttl=300)
+            def generate_payment_pie(expenses):
+                return self.viz.create_payment_pie_chart(expenses)
+            
+            payment_pie = generate_payment_pie(expenses)
             st.plotly_chart(payment_pie, use_container_width=True, config={'displayModeBar': False}, key="expenses_payment_pie_chart")
         
         except Exception as e:
@@ -960,29 +989,45 @@ class ROIAnalysisTab(BaseTab):
         The break-even timeline accounts for job search periods and realistic savings rates.
         """)
         
+        # Build both charts once per distinct ROI input; reruns reuse the cache
+        @st.cache_data(ttl=300)
+        def generate_roi_charts(roi_analysis):
+            return (
+                self.viz.create_roi_analysis_chart(roi_analysis),
+                self.viz.create_break_even_timeline_chart(roi_analysis)
+            )
+        
+        degree_chart, timeline_chart = generate_roi_charts(roi_analysis)
+        
         # Create two columns for individual charts
         col1, col2 = st.columns(2)
         
         with col1:
             # Degree Cost vs Salaries chart
-            degree_chart = self.viz.create_roi_analysis_chart(roi_analysis)
             st.plotly_chart(degree_chart, use_container_width=True, config={'displayModeBar': False}, key="roi_degree_chart")
         
         with col2:
             # Break-even Timeline chart
-            timeline_chart = self.viz.create_break_even_timeline_chart(roi_analysis)
             st.plotly_chart(timeline_chart, use_container_width=True, config={'displayModeBar': False}, key="roi_timeline_chart")
     
     def _render_city_comparisons(self):
         """Render city comparison charts"""
         st.markdown("### City Comparisons")
         
+        # Build both charts once per distinct input; reruns reuse the cache
+        @st.cache_data(ttl=300)
+        def generate_city_charts(salary_data, city_costs):
+            return (
+                self.viz.create_salary_comparison_chart(salary_data),
+                self.viz.create_city_comparison_chart(city_costs)
+            )
+        
+        salary_chart, cost_chart = generate_city_charts(self.data['salary_data'], self.data['city_costs'])
+        
         # Top chart: Annual Salary by Role and City
-        salary_chart = self.viz.create_salary_comparison_chart(self.data['salary_data'])
         st.plotly_chart(salary_chart, use_container_width=True, config={'displayModeBar': False}, key="city_salary_chart")
         
         # Bottom chart: Monthly Cost Comparison by City and Category
-        cost_chart = self.viz.create_city_comparison_chart(self.data['city_costs'])
         st.plotly_chart(cost_chart, use_container_width=True, config={'displayModeBar': False}, key="city_cost_chart")
     
     def _render_roi_insights(self):
@@ -1341,8 +1386,12 @@ class StoryTab(BaseTab):
                     if m.get('type', '').lower() == timeline_filter.lower()
                 ]
             
-            # Enhanced timeline chart
-            timeline_chart = self.viz.create_timeline_chart(filtered_milestones)
+            # Enhanced timeline chart, rebuilt only when the filter selection changes
+            @st.cache_data(ttl=300)
+            def generate_timeline_chart(milestones):
+                return self.viz.create_timeline_chart(milestones)
+            
+            timeline_chart = generate_timeline_chart(filtered_milestones)
             st.plotly_chart(timeline_chart, use_container_width=True, config={'displayModeBar': False}, key="story_timeline_chart")
         
         except Exception as e:
@@ -90,7 +90,7 @@ class DataProcessor:
         self.expenses_df = self.expenses_df.drop_duplicates()
         
         # Handle missing values
-        self.expenses_df['Amount'] = self.expenses_df['Amount'].fillna(0)
+        self.expenses_df['Amount'] = self._clean_numeric_column(self.expenses_df['Amount'])
         self.expenses_df['Category'] = self.expenses_df['Category'].fillna('Miscellaneous')
         self.expenses_df['PaymentType'] = self.expenses_df['PaymentType'].fillna('Unknown')
         
@@ -114,7 +114,7 @@ class DataProcessor:
         self.salary_df = self.salary_df.drop_duplicates()
         
         # Handle missing values
-        self.salary_df['Amount'] = self.salary_df['Amount'].fillna(0)
+        self.salary_df['Amount'] = self._clean_numeric_column(self.salary_df['Amount'])
         
         # Validate amounts
         self.salary_df = self.salary_df[self.salary_df['Amount'] >= 0]
@@ -126,6 +126,23 @@ class DataProcessor:
         
         print(f"Cleaned salary data: {len(self.salary_df)} records")
     
+    def _clean_numeric_column(self, series: pd.Series, fill_value: float = 0) -> pd.Series:
+        """
+        Coerce a column to numbers and fill missing values
+        
+        Args:
+            series: Column to clean
+            fill_value: Value used for missing or unparseable entries
+            
+        Returns:
+            Numeric Series
+        """
+        # Numeric columns (the usual CSV case) only need their NaNs filled;
+        # the per-element parse is reserved for text columns
+        if series.dtype.kind not in 'iuf':
+            series = pd.to_numeric(series, errors='coerce')
+        return series.fillna(fill_value)
+    
     def _categorize_expenses(self, categories: pd.Series) -> pd.Series:
         """Categorize expenses into broader groups"""
         category_mapping = {
@@ -164,7 +181,7 @@ class DataProcessor:
             salary_issues.append("Large salary amounts detected")
         
         # Check for missing categories
-        if self.expenses_df['Category'].isnull().sum() > 0:
+        if self.expenses_df['Category'].hasnans:
             expense_issues.append("Missing categories found")
         
         if len(expense_issues) > 0:
@@ -268,26 +285,21 @@ class DataProcessor:
         Returns:
             DataFrame with detected anomalies
         """
-        # Calculate statistics by category
-        category_stats = self.expenses_df.groupby('Category')['Amount'].agg(['mean', 'std']).reset_index()
-        
-        # Merge with original data
-        expenses_with_stats = self.expenses_df.merge(category_stats, on='Category', suffixes=('', '_stats'))
-        
-        # Calculate z-score
-        expenses_with_stats['z_score'] = (
-            (expenses_with_stats['Amount'] - expenses_with_stats['mean']) / 
-            expenses_with_stats['std']
-        )
-        
-        # Identify anomalies
-        anomalies = expenses_with_stats[
-            (expenses_with_stats['z_score'].abs() > threshold) &
-            (expenses_with_stats['Amount'] > 0)
-        ].copy()
+        # Per-row category statistics, aligned to the expenses without a merge
+        amount_by_category = self.expenses_df.groupby('Category')['Amount']
+        amounts = self.expenses_df['Amount'].to_numpy(dtype=np.float64)
+        means = amount_by_category.transform('mean').to_numpy(dtype=np.float64)
+        stds = amount_by_category.transform('std').to_numpy(dtype=np.float64)
+        
+        # |z| > threshold  <=>  |amount - mean| > threshold * std; compare
+        # the scaled deviation in place instead of building a z-score array
+        deviation = amounts - means
+        np.abs(deviation, out=deviation)
+        mask = deviation > threshold * stds
+        mask &= amounts > 0
         
         # Select relevant columns
-        anomalies = anomalies[['Date', 'Category', 'Amount', 'PaymentType']]
+        anomalies = self.expenses_df.loc[mask, ['Date', 'Category', 'Amount', 'PaymentType']]
         
         return anomalies.sort_values('Amount', ascending=False)
     
@@ -433,29 +445,29 @@ def main():
     """Test the data processor"""
     processor = DataProcessor()
     
+    # Load and clean data; missing or malformed files are the expected failure
     try:
-        # Load and clean data
-        data = processor.load_data()
+        processor.load_data()
         processor.clean_data()
-        
-        # Test monthly summary
-        monthly_summary = processor.get_monthly_summary()
-        print(f"Monthly summary created: {len(monthly_summary)} months")
-        
-        # Test category breakdown
-        category_breakdown = processor.get_category_breakdown()
-        print(f"Category breakdown created: {len(category_breakdown)} categories")
-        
-        # Test anomaly detection
-        anomalies = processor.get_anomalies()
-        print(f"Anomaly detection completed: {len(anomalies)} anomalies found")
-        
-        # Test ROI analysis
-        roi_analysis = processor.get_roi_analysis()
-        print(f"ROI analysis completed: Break-even in {roi_analysis['break_even_years']:.1f} years")
-        
     except Exception as e:
         print(f"Error in data processing: {str(e)}")
+        return
+    
+    # Test monthly summary
+    monthly_summary = processor.get_monthly_summary()
+    print(f"Monthly summary created: {len(monthly_summary)} months")
+    
+    # Test category breakdown
+    category_breakdown = processor.get_category_breakdown()
+    print(f"Category breakdown created: {len(category_breakdown)} categories")
+    
+    # Test anomaly detection
+    anomalies = processor.get_anomalies()
+    print(f"Anomaly detection completed: {len(anomalies)} anomalies found")
+    
+    # Test ROI analysis
+    roi_analysis = processor.get_roi_analysis()
+    print(f"ROI analysis completed: Break-even in {roi_analysis['break_even_years']:.1f} years")
 
 
 if __name__ == "__main__":
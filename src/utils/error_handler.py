@@ -116,10 +116,16 @@ class ErrorHandler:
             )
             return False
         
-        missing_fields = []
-        for field in required_fields:
-            if not hasattr(data, field) or getattr(data, field) is None:
-                missing_fields.append(field)
+        columns = getattr(data, 'columns', None)
+        if columns is not None:
+            # Tabular data: one set of column names, one hash probe per field
+            available = set(columns)
+            missing_fields = [field for field in required_fields if field not in available]
+        else:
+            missing_fields = []
+            for field in required_fields:
+                if not hasattr(data, field) or getattr(data, field) is None:
+                    missing_fields.append(field)
         
         if missing_fields:
             self.display_error(
@@ -4,14 +4,14 @@ Core chart types with consistent styling and professional layouts
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from typing import Dict, List
+import importlib.util
 import sys
 import os
 import warnings
-from plotly.subplots import make_subplots
 
 # Suppress FutureWarning for pandas datetime operations
 warnings.filterwarnings('ignore', category=FutureWarning, module='pandas')
@@ -26,7 +26,137 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import (
     CHART_COLORS, CHART_LAYOUT, CHART_TEMPLATES
 )
-from config.design_system import COLORS, COMPONENT_SIZES, get_chart_layout, get_hover_template, get_hover_label_config
+from config.design_system import COLORS, COMPONENT_SIZES
+
+__all__ = ['DashboardVisualizations', 'figure_to_json']
+
+# Above this many points, spline smoothing costs more to render than it adds
+SPLINE_MAX_POINTS = 50
+
+# Above this many markers, scatter traces render with WebGL instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+
+# RGB components of each hex design-system color, parsed once at import
+_RGB = {
+    name: tuple(int(value[i:i + 2], 16) for i in (1, 3, 5))
+    for name, value in COLORS.items() if value.startswith('#')
+}
+
+# rgba() templates per color; fill in the alpha with .format(a=...)
+_RGBA = {name: f'rgba({r}, {g}, {b}, {{a}})' for name, (r, g, b) in _RGB.items()}
+
+# Translucent fills used by annotations, legends, area traces and the modebar
+SURFACE_RGBA_090 = _RGBA['surface'].format(a=0.9)
+SURFACE_RGBA_095 = _RGBA['surface'].format(a=0.95)
+WARNING_RGBA_095 = _RGBA['warning'].format(a=0.95)
+SUCCESS_RGBA_095 = _RGBA['success'].format(a=0.95)
+ACCENT1_RGBA_020 = _RGBA['accent1'].format(a=0.2)
+
+
+def _merge_layout(base: Dict, updates: Dict) -> Dict:
+    """
+    Recursively merge layout overrides into a copy of a base layout dict
+    
+    Nested dicts are merged key by key, like fig.update_layout; any other
+    value (including lists) replaces the base value. Charts pass the merged
+    dict to go.Figure once, instead of validating follow-up update_layout /
+    update_xaxes / update_yaxes passes.
+    """
+    merged = dict(base)
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_layout(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+# Empty-state figures by message, built on first use and shared afterwards;
+# callers must not mutate them
+_NO_DATA_FIGURES: Dict[str, go.Figure] = {}
+
+
+# Marker color and symbol per timeline milestone type
+MILESTONE_TYPE_STYLES = {
+    'academic': (COLORS['primary'], 'diamond'),
+    'employment': (COLORS['success'], 'star'),
+    'personal': (COLORS['accent1'], 'circle'),
+    'financial': (COLORS['warning'], 'square'),
+}
+DEFAULT_MILESTONE_STYLE = (COLORS['text_muted'], 'diamond')
+
+# Serialize figures with orjson when installed: it encodes NumPy arrays
+# natively instead of converting them element by element. Setting Plotly's
+# default engine also covers plotly.io.to_json, which st.plotly_chart uses.
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None
+if HAS_ORJSON:
+    import orjson
+    pio.json.config.default_engine = 'orjson'
+
+
+def figure_to_json(fig: go.Figure) -> bytes:
+    """
+    Serialize a figure to JSON bytes for the browser
+    
+    Args:
+        fig: Plotly figure to serialize
+        
+    Returns:
+        UTF-8 encoded figure JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                fig.to_dict(),
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # Object arrays (labels, timestamps) need Plotly's cleaning pass
+            pass
+    return pio.to_json(fig, validate=False).encode('utf-8')
+
+
+def _lttb_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select row positions with Largest-Triangle-Three-Buckets downsampling
+    
+    Args:
+        values: Evenly spaced y-series to downsample
+        max_points: Number of points to keep (first and last always kept)
+        
+    Returns:
+        Sorted array of selected positions
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = y.size
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    
+    anchor = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < edges.size:
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Triangle area between the anchor, each bucket point and the next bucket's mean
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[start:end] - y[anchor]) -
+            (x[anchor] - x[start:end]) * (avg_y - y[anchor])
+        )
+        anchor = start + int(area.argmax())
+        selected[i + 1] = anchor
+    
+    return selected
 
 
 class DashboardVisualizations:
@@ -41,6 +171,50 @@ class DashboardVisualizations:
         self.chart_layout = CHART_LAYOUT
         self.chart_templates = CHART_TEMPLATES
         
+        # Layout-level hover label; traces only override the border color
+        self._hover_base = {
+            'bgcolor': 'rgba(0,0,0,0)',  # Transparent background
+            'font': {
+                'color': COLORS['text_primary'],
+                'family': 'Inter, sans-serif',
+                'size': 12
+            }
+        }
+        
+        # Empty-state figure spec shared by every chart's no-data branch
+        self._no_data_fig_dict = {
+            'data': [],
+            'layout': {
+                'annotations': [{
+                    'text': "No data available for the selected filters",
+                    'xref': 'paper',
+                    'yref': 'paper',
+                    'x': 0.5,
+                    'y': 0.5,
+                    'showarrow': False,
+                    'font': {'size': 16, 'color': COLORS['text_muted']}
+                }],
+                'title': {'text': 'No Data Available'},
+                'height': 400,
+                'paper_bgcolor': 'rgba(0,0,0,0)',  # Transparent background
+                'plot_bgcolor': 'rgba(0,0,0,0)'  # Transparent plot background
+            }
+        }
+        
+    def _no_data_figure(self, message: str = None) -> go.Figure:
+        """Get the shared empty-state figure, optionally with a custom message"""
+        fig = _NO_DATA_FIGURES.get(message)
+        if fig is None:
+            fig_dict = self._no_data_fig_dict
+            if message is not None:
+                annotation = {**fig_dict['layout']['annotations'][0], 'text': message}
+                fig_dict = {
+                    'data': [],
+                    'layout': {**fig_dict['layout'], 'annotations': [annotation]}
+                }
+            fig = _NO_DATA_FIGURES[message] = go.Figure(fig_dict)
+        return fig
+    
     def _get_standard_legend_config(self):
         """Get standardized legend configuration for all charts"""
         font_sizes = self._get_standard_font_sizes()
@@ -67,18 +241,41 @@ class DashboardVisualizations:
         return dict(l=80, r=120, t=100, b=100)
     
     def _get_standard_hoverlabel_config(self, border_color: str = None):
-        """Get standardized hover label configuration for all charts"""
+        """
+        Get the per-trace hover label override
+        
+        Background and font are set once on the layout (see
+        _get_professional_layout); traces only override the border color.
+        """
         if border_color is None:
             border_color = COLORS['primary']
         
+        return {'bordercolor': border_color}
+    
+    def _get_arrow_annotation_config(self, x, y, text: str, color: str, bgcolor: str) -> Dict:
+        """Get an arrowed callout annotation in the timeline chart style"""
         return dict(
-            bgcolor='rgba(0,0,0,0)',  # Transparent background
-            bordercolor=border_color,
+            x=x,
+            y=y,
+            xref="x",
+            yref="y",
+            text=text,
+            showarrow=True,
+            arrowhead=2,
+            arrowsize=1,
+            arrowwidth=2,
+            arrowcolor=color,
             font=dict(
+                size=12, 
                 color=COLORS['text_primary'],
-                family='Inter, sans-serif',
-                size=12
-            )
+                family='Inter, sans-serif'
+            ),
+            bgcolor=bgcolor,
+            bordercolor=color,
+            borderwidth=2,
+            align='center',
+            xanchor='center',
+            yanchor='bottom'
         )
     
     def _get_standard_font_sizes(self):
@@ -156,15 +353,39 @@ class DashboardVisualizations:
         
         return formatted
         
-    def _apply_professional_layout(self, fig: go.Figure, title: str = None, 
-                                 height: int = None, template: str = None) -> go.Figure:
-        """Apply premium professional layout to all charts with deep navy theme"""
+    def _get_professional_layout(self, title: str = None, height: int = None,
+                                 template: str = None) -> Dict:
+        """Build the premium professional layout (deep navy theme) as a plain dict"""
         height = height or COMPONENT_SIZES['chart_height']
         template = template or self.chart_templates['premium']
+        font_sizes = self._get_standard_font_sizes()
+        
+        # Premium axis styling shared by the x and y axes
+        axis_style = {
+            'gridcolor': COLORS['grid'],
+            'gridwidth': 1,
+            'zerolinecolor': COLORS['border'],
+            'zerolinewidth': 1,
+            'showline': True,
+            'linecolor': COLORS['border'],
+            'linewidth': 1,
+            'title': {
+                'font': {
+                    'color': COLORS['text_primary'],
+                    'family': 'Inter, sans-serif',
+                    'size': font_sizes['axis_title']
+                }
+            },
+            'tickfont': {
+                'color': COLORS['text_secondary'],
+                'family': 'Inter, sans-serif',
+                'size': font_sizes['axis_tick']
+            }
+        }
         
         # Premium chart layout with deep navy theme
-        fig.update_layout(
-            title={
+        return {
+            'title': {
                 'text': title,
                 'x': 0.5,
                 'xanchor': 'center',
@@ -176,78 +397,41 @@ class DashboardVisualizations:
                     'family': 'Inter, sans-serif'
                 }
             },
-            height=height,
-            template=template,
-            paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-            plot_bgcolor='rgba(0,0,0,0)',  # Transparent plot background
-            margin=dict(l=80, r=80, t=100, b=80),
-            showlegend=True,
-            legend=self._get_standard_legend_config(),
-            hovermode='closest',
-            dragmode='zoom',
-            modebar=dict(
+            'height': height,
+            'template': template,
+            'paper_bgcolor': 'rgba(0,0,0,0)',  # Transparent background
+            'plot_bgcolor': 'rgba(0,0,0,0)',  # Transparent plot background
+            'margin': dict(l=80, r=80, t=100, b=80),
+            'showlegend': True,
+            'legend': self._get_standard_legend_config(),
+            'hovermode': 'closest',
+            'hoverlabel': {**self._hover_base, 'bordercolor': COLORS['primary']},
+            'dragmode': 'zoom',
+            'modebar': dict(
                 orientation='v',
-                bgcolor=f'rgba({int(COLORS["surface"][1:3], 16)}, {int(COLORS["surface"][3:5], 16)}, {int(COLORS["surface"][5:7], 16)}, 0.9)',
+                bgcolor=SURFACE_RGBA_090,
                 color=COLORS['text_muted'],
                 activecolor=COLORS['primary'],
                 remove=['pan', 'select', 'lasso2d']
             ),
-            font=dict(
+            'font': dict(
                 family='Inter, sans-serif',
                 color=COLORS['text_secondary']
-            )
-        )
-        
-        # Update axes with premium styling
-        font_sizes = self._get_standard_font_sizes()
-        fig.update_xaxes(
-            gridcolor=COLORS['grid'],
-            gridwidth=1,
-            zerolinecolor=COLORS['border'],
-            zerolinewidth=1,
-            showline=True,
-            linecolor=COLORS['border'],
-            linewidth=1,
-            title_font=dict(
-                color=COLORS['text_primary'],
-                family='Inter, sans-serif',
-                size=font_sizes['axis_title']
-            ),
-            tickfont=dict(
-                color=COLORS['text_secondary'],
-                family='Inter, sans-serif',
-                size=font_sizes['axis_tick']
-            )
-        )
-        
-        fig.update_yaxes(
-            gridcolor=COLORS['grid'],
-            gridwidth=1,
-            zerolinecolor=COLORS['border'],
-            zerolinewidth=1,
-            showline=True,
-            linecolor=COLORS['border'],
-            linewidth=1,
-            title_font=dict(
-                color=COLORS['text_primary'],
-                family='Inter, sans-serif',
-                size=font_sizes['axis_title']
             ),
-            tickfont=dict(
-                color=COLORS['text_secondary'],
-                family='Inter, sans-serif',
-                size=font_sizes['axis_tick']
-            )
-        )
-        
-        return fig
-        
-    def create_monthly_trend_chart(self, monthly_data: pd.DataFrame) -> go.Figure:
+            'xaxis': axis_style,
+            'yaxis': axis_style
+        }
+    
+    def create_monthly_trend_chart(self, monthly_data: pd.DataFrame,
+                                   max_points: int = 2000) -> go.Figure:
         """
         Create premium monthly trend chart with enhanced styling and interactions
         
         Args:
             monthly_data: DataFrame with monthly summaries
+            max_points: Upper bound on plotted rows (for budgets of 12 or more);
+                longer inputs are LTTB downsampled with the budget split evenly
+                across the four series
             
         Returns:
             Plotly figure object
@@ -257,133 +441,147 @@ class DashboardVisualizations:
             monthly_data = monthly_data.copy()
             monthly_data['YearMonth'] = monthly_data['YearMonth'].astype(str)
         
-        fig = go.Figure()
-        
-        # Enhanced expense line with premium styling
-        fig.add_trace(go.Scatter(
-            x=monthly_data['YearMonth'].astype(str),
-            y=monthly_data['TotalExpenses'],
-            mode='lines+markers',
-            name='Expenses',
-            line=dict(
-                color=COLORS['secondary'], 
-                width=4,
-                shape='spline'
-            ),
-            marker=dict(
-                size=10, 
-                symbol='circle',
-                color=COLORS['secondary'],
-                line=dict(color=COLORS['background'], width=2)
-            ),
-            hovertemplate='<b>%{x}</b><br>' +
-                         '<span style="color: ' + COLORS['error'] + ';">Expenses: $%{y:,.0f}</span><extra></extra>',
-            hoverlabel=self._get_standard_hoverlabel_config(COLORS['secondary'])
-        ))
-        
-        # Enhanced income line with premium styling
-        fig.add_trace(go.Scatter(
-            x=monthly_data['YearMonth'].astype(str),
-            y=monthly_data['TotalIncome'],
-            mode='lines+markers',
-            name='Income',
-            line=dict(
-                color=COLORS['primary'], 
-                width=4,
-                shape='spline'
-            ),
-            marker=dict(
-                size=10, 
-                symbol='diamond',
-                color=COLORS['primary'],
-                line=dict(color=COLORS['background'], width=2)
-            ),
-            hovertemplate='<b>%{x}</b><br>' +
-                         '<span style="color: ' + COLORS['success'] + ';">Income: $%{y:,.0f}</span><extra></extra>',
-            hoverlabel=self._get_standard_hoverlabel_config(COLORS['primary'])
-        ))
-        
-        # Enhanced net amount line with premium styling
-        fig.add_trace(go.Scatter(
-            x=monthly_data['YearMonth'].astype(str),
-            y=monthly_data['NetAmount'],
-            mode='lines+markers',
-            name='Net Amount',
-            line=dict(
-                color=COLORS['accent3'], 
-                width=4, 
-                dash='dash',
-                shape='spline'
+        # Downsample dense series; each series gets an equal share of the
+        # budget so the union of their rows stays within max_points
+        if len(monthly_data) > max_points:
+            series_columns = ['TotalExpenses', 'TotalIncome', 'NetAmount', 'CumulativeNet']
+            per_series = max(max_points // len(series_columns), 3)
+            keep = np.unique(np.concatenate([
+                _lttb_indices(monthly_data[col].to_numpy(), per_series)
+                for col in series_columns
+            ]))
+            monthly_data = monthly_data.iloc[keep]
+        
+        # Dense series render as straight segments to skip client-side spline work
+        line_shape = 'spline' if len(monthly_data) <= SPLINE_MAX_POINTS else 'linear'
+        
+        x_months = monthly_data['YearMonth'].astype(str).to_numpy()
+        
+        traces = [
+            # Enhanced expense line with premium styling
+            dict(
+                type='scatter',
+                x=x_months,
+                y=monthly_data['TotalExpenses'].to_numpy(),
+                mode='lines+markers',
+                name='Expenses',
+                line=dict(
+                    color=COLORS['secondary'], 
+                    width=4,
+                    shape=line_shape
+                ),
+                marker=dict(
+                    size=10, 
+                    symbol='circle',
+                    color=COLORS['secondary'],
+                    line=dict(color=COLORS['background'], width=2)
+                ),
+                hovertemplate='<b>%{x}</b><br>' +
+                             '<span style="color: ' + COLORS['error'] + ';">Expenses: $%{y:,.0f}</span><extra></extra>',
+                hoverlabel=self._get_standard_hoverlabel_config(COLORS['secondary'])
             ),
-            marker=dict(
-                size=10, 
-                symbol='square',
-                color=COLORS['accent3'],
-                line=dict(color=COLORS['background'], width=2)
+            # Enhanced income line with premium styling
+            dict(
+                type='scatter',
+                x=x_months,
+                y=monthly_data['TotalIncome'].to_numpy(),
+                mode='lines+markers',
+                name='Income',
+                line=dict(
+                    color=COLORS['primary'], 
+                    width=4,
+                    shape=line_shape
+                ),
+                marker=dict(
+                    size=10, 
+                    symbol='diamond',
+                    color=COLORS['primary'],
+                    line=dict(color=COLORS['background'], width=2)
+                ),
+                hovertemplate='<b>%{x}</b><br>' +
+                             '<span style="color: ' + COLORS['success'] + ';">Income: $%{y:,.0f}</span><extra></extra>'
             ),
-            hovertemplate='<b>%{x}</b><br>' +
-                         '<span style="color: ' + COLORS['accent3'] + ';">Net: $%{y:,.0f}</span><extra></extra>',
-            hoverlabel=self._get_standard_hoverlabel_config(COLORS['accent3'])
-        ))
-        
-        # Enhanced cumulative net area with premium styling
-        fig.add_trace(go.Scatter(
-            x=monthly_data['YearMonth'].astype(str),
-            y=monthly_data['CumulativeNet'],
-            mode='lines',
-            name='Cumulative Net',
-            line=dict(
-                color=COLORS['accent1'], 
-                width=3,
-                shape='spline'
+            # Enhanced net amount line with premium styling
+            dict(
+                type='scatter',
+                x=x_months,
+                y=monthly_data['NetAmount'].to_numpy(),
+                mode='lines+markers',
+                name='Net Amount',
+                line=dict(
+                    color=COLORS['accent3'], 
+                    width=4, 
+                    dash='dash',
+                    shape=line_shape
+                ),
+                marker=dict(
+                    size=10, 
+                    symbol='square',
+                    color=COLORS['accent3'],
+                    line=dict(color=COLORS['background'], width=2)
+                ),
+                hovertemplate='<b>%{x}</b><br>' +
+                             '<span style="color: ' + COLORS['accent3'] + ';">Net: $%{y:,.0f}</span><extra></extra>',
+                hoverlabel=self._get_standard_hoverlabel_config(COLORS['accent3'])
             ),
-            fill='tonexty',
-            fillcolor=f'rgba({int(COLORS["accent1"][1:3], 16)}, {int(COLORS["accent1"][3:5], 16)}, {int(COLORS["accent1"][5:7], 16)}, 0.2)',
-            hovertemplate='<b>%{x}</b><br>' +
-                         '<span style="color: ' + COLORS['accent1'] + ';">Cumulative: $%{y:,.0f}</span><extra></extra>',
-            hoverlabel=self._get_standard_hoverlabel_config(COLORS['accent1'])
-        ))
-        
-        # Apply premium professional layout
-        fig = self._apply_professional_layout(
-            fig, 
-            title='Monthly Financial Trends & Cumulative Growth',
-            height=500
-        )
+            # Enhanced cumulative net area with premium styling
+            dict(
+                type='scatter',
+                x=x_months,
+                y=monthly_data['CumulativeNet'].to_numpy(),
+                mode='lines',
+                name='Cumulative Net',
+                line=dict(
+                    color=COLORS['accent1'], 
+                    width=3,
+                    shape=line_shape
+                ),
+                fill='tonexty',
+                fillcolor=ACCENT1_RGBA_020,
+                hovertemplate='<b>%{x}</b><br>' +
+                             '<span style="color: ' + COLORS['accent1'] + ';">Cumulative: $%{y:,.0f}</span><extra></extra>',
+                hoverlabel=self._get_standard_hoverlabel_config(COLORS['accent1'])
+            )
+        ]
         
-        # Enhanced axes with premium styling
-        # Convert YearMonth strings back to datetime for formatting
+        # Convert YearMonth strings back to datetime for tick labels
         yearmonth_dates = pd.to_datetime(monthly_data['YearMonth'] + '-01')
         
-        fig.update_xaxes(
-            title='Month',
-            tickangle=45,
-            tickmode='array',
-            ticktext=yearmonth_dates.dt.strftime('%b %Y'),
-            tickvals=monthly_data['YearMonth'].astype(str)
-        )
-        
-        fig.update_yaxes(
-            title='Amount ($)',
-            tickformat='$,.0f',
-            zeroline=True,
-            zerolinecolor=COLORS['border'],
-            zerolinewidth=2
-        )
-        
-        # Enhanced hover mode for better interaction
-        fig.update_layout(
-            hovermode='x unified',
-            hoverdistance=100,
-            spikedistance=1000,
-            # Enhanced legend configuration - positioned outside chart area
-            showlegend=True,
-            legend=self._get_standard_legend_config(),
-            # Increase right margin to accommodate the legend
-            margin=self._get_standard_margin_config()
+        # Premium professional layout plus chart-specific overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Monthly Financial Trends & Cumulative Growth',
+                height=500
+            ),
+            {
+                # Enhanced axes with premium styling
+                'xaxis': {
+                    'title': {'text': 'Month'},
+                    'tickangle': 45,
+                    'tickmode': 'array',
+                    'ticktext': yearmonth_dates.dt.strftime('%b %Y').to_numpy(),
+                    'tickvals': x_months
+                },
+                'yaxis': {
+                    'title': {'text': 'Amount ($)'},
+                    'tickformat': '$,.0f',
+                    'zeroline': True,
+                    'zerolinecolor': COLORS['border'],
+                    'zerolinewidth': 2
+                },
+                # Enhanced hover mode for better interaction
+                'hovermode': 'x unified',
+                'hoverdistance': 100,
+                'spikedistance': 1000,
+                # Enhanced legend configuration - positioned outside chart area
+                'showlegend': True,
+                'legend': self._get_standard_legend_config(),
+                # Increase right margin to accommodate the legend
+                'margin': self._get_standard_margin_config()
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_category_breakdown_chart(self, category_data: pd.DataFrame) -> go.Figure:
         """
@@ -397,87 +595,62 @@ class DashboardVisualizations:
         """
         # Handle empty or invalid data
         if category_data.empty or category_data['Amount'].sum() == 0:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available for the selected filters",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=16, color=COLORS['text_muted'])
-            )
-            fig.update_layout(
-                title='No Data Available',
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-                plot_bgcolor='rgba(0,0,0,0)'  # Transparent plot background
-            )
-            return fig
-        
-        # Create individual pie chart for category distribution
-        fig = go.Figure()
+            return self._no_data_figure()
         
         # Enhanced pie chart with premium styling - completely redesigned for maximum text visibility
-        fig.add_trace(
-            go.Pie(
-                labels=[self._format_label_for_display(cat) for cat in category_data['Category']],
-                values=category_data['Amount'],
-                name="Category Distribution",  # More descriptive name
-                hole=0,  # No hole - solid pie chart
-                marker=dict(
-                    colors=[CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(category_data))],
-                    line=dict(color=COLORS['background'], width=1)  # Thinner line for cleaner look
-                ),
-                textinfo='percent',
-                textposition='inside',
-                textfont=dict(
-                    color=COLORS['text_primary'],
-                    size=10,  # Smaller text to fit better in smaller slices
-                    family='Inter, sans-serif'
-                ),
+        traces = [dict(
+            type='pie',
+            labels=[self._format_label_for_display(cat) for cat in category_data['Category']],
+            values=category_data['Amount'].to_numpy(),
+            name="Category Distribution",  # More descriptive name
+            hole=0,  # No hole - solid pie chart
+            marker=dict(
+                colors=[CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(category_data))],
+                line=dict(color=COLORS['background'], width=1)  # Thinner line for cleaner look
+            ),
+            textinfo='percent',
+            textposition='inside',
+            textfont=dict(
+                color=COLORS['text_primary'],
+                size=10,  # Smaller text to fit better in smaller slices
+                family='Inter, sans-serif'
+            ),
             hovertemplate='<b>%{label}</b><br>' +
                          'Amount: $%{value:,.0f}<br>' +
-                             'Percentage: %{percent:.1%}<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=COLORS['primary'],
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-            )
-        )
-        
-
-        
-        # Apply premium professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Category Distribution',
-            height=500
-        )
-        
-        # Enhanced layout for standalone pie chart with legend - positioned on right side
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend to right side, outside chart area (consistent with other charts)
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10  # Increased font size for better readability
-                ),
-                itemsizing='constant',  # Consistent legend item sizes
-                itemwidth=30  # Control legend item width (minimum valid value)
+                         'Percentage: %{percent:.1%}<extra></extra>'
+        )]
+        
+        # Premium professional layout plus standalone pie overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Category Distribution',
+                height=500  # Optimized height for single chart
             ),
-            margin=dict(l=80, r=120, t=100, b=100),  # Balanced margins: left=80, right=120 for legend
-            height=500  # Optimized height for single chart
+            {
+                # Legend positioned on the right side, outside the chart area
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,  # Move legend to right side, outside chart area (consistent with other charts)
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
+                    font=dict(
+                        color=COLORS['text_primary'],
+                        family='Inter, sans-serif',
+                        size=10  # Increased font size for better readability
+                    ),
+                    itemsizing='constant',  # Consistent legend item sizes
+                    itemwidth=30  # Control legend item width (minimum valid value)
+                ),
+                'margin': dict(l=80, r=120, t=100, b=100)  # Balanced margins: left=80, right=120 for legend
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_category_comparison_chart(self, category_data: pd.DataFrame) -> go.Figure:
         """
@@ -491,78 +664,46 @@ class DashboardVisualizations:
         """
         # Handle empty or invalid data
         if category_data.empty or category_data['Amount'].sum() == 0:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available for the selected filters",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=16, color=COLORS['text_muted'])
-            )
-            fig.update_layout(
-                title='No Data Available',
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-                plot_bgcolor='rgba(0,0,0,0)'  # Transparent plot background
-            )
-            return fig
-        
-        # Create standalone horizontal bar chart
-        fig = go.Figure()
+            return self._no_data_figure()
         
         # Enhanced horizontal bar chart with premium styling
-        fig.add_trace(
-            go.Bar(
-                y=[self._format_label_for_display(cat) for cat in category_data['Category']],  # Categories on Y-axis for horizontal bars
-                x=category_data['Amount'],    # Amounts on X-axis
-                name="Category Comparison",
-                orientation='h',              # Horizontal orientation
-                marker=dict(
-                    color=[CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(category_data))],
-                    line=dict(color=COLORS['background'], width=1),
-                    opacity=0.8
-                ),
-                text=category_data['Amount'].apply(lambda x: f'${x:,.0f}'),
-                textposition='auto',
-                textfont=dict(
-                    color=COLORS['text_primary'],
-                    size=10,
-                    family='Inter, sans-serif'
-                ),
-                hovertemplate='<b>%{y}</b><br>' +
-                             'Amount: $%{x:,.0f}<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=COLORS['primary'],
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-            )
-        )
-        
-        # Apply premium professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Category Comparison',
-            height=500
-        )
-        
-        # Enhanced horizontal bar chart axes
-        fig.update_xaxes(
-            title="Amount ($)",
-            tickformat='$,.0f'
-        )
-        
-        fig.update_yaxes(
-            title="Category"
-        )
-        
-        # Enhanced layout for standalone bar chart
-        fig.update_layout(
-            showlegend=False,  # No legend needed for single chart
-            margin=dict(l=80, r=50, t=100, b=100),
-            height=500
+        traces = [dict(
+            type='bar',
+            y=[self._format_label_for_display(cat) for cat in category_data['Category']],  # Categories on Y-axis for horizontal bars
+            x=category_data['Amount'].to_numpy(),    # Amounts on X-axis
+            name="Category Comparison",
+            orientation='h',              # Horizontal orientation
+            marker=dict(
+                color=[CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(category_data))],
+                line=dict(color=COLORS['background'], width=1),
+                opacity=0.8
+            ),
+            texttemplate='$%{x:,.0f}',
+            textposition='auto',
+            textfont=dict(
+                color=COLORS['text_primary'],
+                size=10,
+                family='Inter, sans-serif'
+            ),
+            hovertemplate='<b>%{y}</b><br>' +
+                         'Amount: $%{x:,.0f}<extra></extra>'
+        )]
+        
+        # Premium professional layout plus standalone bar overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Category Comparison',
+                height=500
+            ),
+            {
+                'xaxis': {'title': {'text': "Amount ($)"}, 'tickformat': '$,.0f'},
+                'yaxis': {'title': {'text': "Category"}},
+                'showlegend': False,  # No legend needed for single chart
+                'margin': dict(l=80, r=50, t=100, b=100)
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_category_trend_chart(self, expenses_data: pd.DataFrame, 
                                   search_context: str = None) -> go.Figure:
@@ -578,20 +719,7 @@ class DashboardVisualizations:
         """
         # Handle empty data
         if expenses_data.empty or expenses_data['Amount'].sum() == 0:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available for the selected filters",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=16, color=COLORS['text_muted'])
-            )
-            fig.update_layout(
-                title='No Data Available',
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-                plot_bgcolor='rgba(0,0,0,0)'  # Transparent plot background
-            )
-            return fig
+            return self._no_data_figure()
         
         # Group by month and category
         monthly_categories = expenses_data.groupby([
@@ -606,15 +734,15 @@ class DashboardVisualizations:
         # Convert Period index to string
         pivot_data.index = pivot_data.index.astype(str)
         
-        # Create stacked bar chart
-        fig = go.Figure()
-        
-        # Add traces for each category with premium styling
+        # Create stacked bar chart: one trace per category with premium styling
+        months = pivot_data.index.to_numpy()
+        traces = []
         for i, category in enumerate(pivot_data.columns):
             color = CHART_COLORS[i % len(CHART_COLORS)]
-            fig.add_trace(go.Bar(
-                x=pivot_data.index,
-                y=pivot_data[category],
+            traces.append(dict(
+                type='bar',
+                x=months,
+                y=pivot_data[category].to_numpy(),
                 name=self._format_label_for_display(category),
                 marker=dict(
                     color=color,
@@ -624,52 +752,45 @@ class DashboardVisualizations:
                 hovertemplate='<b>%{fullData.name}</b><br>' +
                              'Month: %{x}<br>' +
                              'Amount: $%{y:,.0f}<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=color,
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
+                hoverlabel=dict(bordercolor=color)
             ))
         
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title=f'Category Trends Over Time{f" - {search_context}" if search_context else ""}',
-            height=500
-        )
-        
-        # Update layout for stacked bars
-        fig.update_layout(
-            barmode='stack',
-            bargap=0.1,
-            bargroupgap=0.05,
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend outside chart area to prevent overlap
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10
-                ),
-                itemsizing='constant',
-                itemwidth=30
+        # Professional layout plus stacked-bar overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title=f'Category Trends Over Time{f" - {search_context}" if search_context else ""}',
+                height=500
             ),
-            # Increase right margin to accommodate the legend
-            margin=dict(l=80, r=120, t=100, b=100)
+            {
+                'xaxis': {'title': {'text': 'Month'}, 'tickangle': 45},
+                'yaxis': {'title': {'text': 'Amount ($)'}, 'tickformat': '$,.0f'},
+                'barmode': 'stack',
+                'bargap': 0.1,
+                'bargroupgap': 0.05,
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,  # Move legend outside chart area to prevent overlap
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
+                    font=dict(
+                        color=COLORS['text_primary'],
+                        family='Inter, sans-serif',
+                        size=10
+                    ),
+                    itemsizing='constant',
+                    itemwidth=30
+                ),
+                # Increase right margin to accommodate the legend
+                'margin': dict(l=80, r=120, t=100, b=100)
+            }
         )
         
-        # Update axes
-        fig.update_xaxes(title='Month', tickangle=45)
-        fig.update_yaxes(title='Amount ($)', tickformat='$,.0f')
-        
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_city_comparison_chart(self, city_costs_data: pd.DataFrame, 
                                    selected_categories: List[str] = None) -> go.Figure:
@@ -690,8 +811,7 @@ class DashboardVisualizations:
             filtered_data = city_costs_data[city_costs_data['Category'].isin(selected_categories)]
             
             # Create grouped bar chart with premium styling
-            fig = go.Figure()
-            
+            traces = []
             for i, category in enumerate(selected_categories):
                 category_data = filtered_data[filtered_data['Category'] == category]
                 color = CHART_COLORS[i % len(CHART_COLORS)]
@@ -699,10 +819,11 @@ class DashboardVisualizations:
                 # Format city names for professional display
                 formatted_cities = [self._format_label_for_display(city) for city in category_data['City']]
                 
-                fig.add_trace(go.Bar(
+                traces.append(dict(
+                    type='bar',
                     name=self._format_label_for_display(category),
                     x=formatted_cities,
-                    y=category_data['Average_Cost'],
+                    y=category_data['Average_Cost'].to_numpy(),
                     marker=dict(
                         color=color,
                         line=dict(color=COLORS['background'], width=1),
@@ -711,70 +832,60 @@ class DashboardVisualizations:
                     hovertemplate='<b>%{x}</b><br>' +
                                  'Category: %{fullData.name}<br>' +
                                  'Average Cost: $%{y:,.0f}<extra></extra>',
-                    hoverlabel=dict(
-                        bgcolor='rgba(0,0,0,0)',  # Transparent background
-                        bordercolor=color,
-                        font=dict(color=COLORS['text_primary'], size=12)
-                    )
+                    hoverlabel=dict(bordercolor=color)
                 ))
             
-            # Apply professional layout
-            fig = self._apply_professional_layout(
-                fig,
-                title='Monthly Cost Comparison by City and Category',
-                height=500
-            )
-            
-            # Update layout for grouped bars with better spacing
-            fig.update_layout(
-                barmode='group',
-                bargap=0.2,
-                bargroupgap=0.15,
-                margin=dict(l=80, r=120, t=100, b=100),  # Increased right margin for legend
-                legend=dict(
-                    orientation="v",  # Changed to vertical for better fit
-                    yanchor="top",
-                    y=0.95,
-                    xanchor="left",
-                    x=1.02,  # Move legend outside chart area to prevent overlap
-                    bgcolor='rgba(0,0,0,0)',
-                    bordercolor='rgba(0,0,0,0)',
-                    borderwidth=0,
-                    font=dict(
-                        color=COLORS['text_primary'],
-                        family='Inter, sans-serif',
-                        size=10
-                    ),
-                    itemsizing='constant',
-                    itemwidth=30
-                )
-            )
-            
-            # Update axes with better alignment
-            # Format city names for professional display
+            # Format city names for professional display on the x-axis ticks
             city_names = filtered_data['City'].unique()
             formatted_city_names = [self._format_label_for_display(city) for city in city_names]
             
-            fig.update_xaxes(
-                title='City',
-                title_font=dict(size=14, color=COLORS['text_primary']),
-                tickfont=dict(size=11, color=COLORS['text_secondary']),
-                tickangle=45,
-                tickmode='array',
-                ticktext=formatted_city_names,
-                tickvals=list(range(len(city_names)))
-            )
-            
-            fig.update_yaxes(
-                title='Monthly Cost ($)',
-                title_font=dict(size=14, color=COLORS['text_primary']),
-                tickfont=dict(size=11, color=COLORS['text_secondary']),
-                tickformat='$,.0f',
-                gridcolor=COLORS['border'],
-                gridwidth=0.5
+            # Professional layout plus grouped-bar overrides, merged once
+            layout = _merge_layout(
+                self._get_professional_layout(
+                    title='Monthly Cost Comparison by City and Category',
+                    height=500
+                ),
+                {
+                    # Axes with better alignment
+                    'xaxis': {
+                        'title': {'text': 'City'},
+                        'tickangle': 45,
+                        'tickmode': 'array',
+                        'ticktext': formatted_city_names,
+                        'tickvals': list(range(len(city_names)))
+                    },
+                    'yaxis': {
+                        'title': {'text': 'Monthly Cost ($)'},
+                        'tickformat': '$,.0f',
+                        'gridcolor': COLORS['border'],
+                        'gridwidth': 0.5
+                    },
+                    # Grouped bars with better spacing
+                    'barmode': 'group',
+                    'bargap': 0.2,
+                    'bargroupgap': 0.15,
+                    'margin': dict(l=80, r=120, t=100, b=100),  # Increased right margin for legend
+                    'legend': dict(
+                        orientation="v",  # Changed to vertical for better fit
+                        yanchor="top",
+                        y=0.95,
+                        xanchor="left",
+                        x=1.02,  # Move legend outside chart area to prevent overlap
+                        bgcolor='rgba(0,0,0,0)',
+                        bordercolor='rgba(0,0,0,0)',
+                        borderwidth=0,
+                        font=dict(
+                            color=COLORS['text_primary'],
+                            family='Inter, sans-serif',
+                            size=10
+                        ),
+                        itemsizing='constant',
+                        itemwidth=30
+                    )
+                }
             )
             
-            return fig
+            return go.Figure(dict(data=traces, layout=layout))
             
         except Exception as e:
             # Create a fallback chart if the main chart fails
@@ -837,8 +948,9 @@ class DashboardVisualizations:
             formatted_cities = [self._format_label_for_display(city) for city in pivot_data.columns]
             
             # Create heatmap with premium styling
-            fig = go.Figure(data=go.Heatmap(
-                z=pivot_data.values,
+            traces = [dict(
+                type='heatmap',
+                z=pivot_data.to_numpy(),
                 x=formatted_cities,
                 y=formatted_roles,
                 colorscale=[
@@ -848,52 +960,38 @@ class DashboardVisualizations:
                     [0.75, COLORS['accent1']],
                     [1, COLORS['primary']]
                 ],
-                text=pivot_data.values,
-                texttemplate='$%{text:,.0f}',
+                texttemplate='$%{z:,.0f}',
                 textfont=dict(size=10, color=COLORS['text_primary']),
-                hoverongaps=False,
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=COLORS['primary'],
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-            ))
-            
-            # Apply professional layout
-            fig = self._apply_professional_layout(fig, title='Annual Salary by Role and City', height=600)
-            
-            # Update axes with better alignment
-            fig.update_xaxes(
-                title='City',
-                title_font=dict(size=14, color=COLORS['text_primary']),
-                tickfont=dict(size=11, color=COLORS['text_secondary']),
-                tickangle=45,
-                tickmode='array',
-                ticktext=formatted_cities,
-                tickvals=list(range(len(formatted_cities)))
-            )
+                hoverongaps=False
+            )]
             
-            fig.update_yaxes(
-                title='Role',
-                title_font=dict(size=14, color=COLORS['text_primary']),
-                tickfont=dict(size=11, color=COLORS['text_secondary'])
-            )
-            
-            # Fix color bar label and improve layout
-            fig.update_layout(
-                coloraxis_colorbar=dict(
-                    title='Annual Salary ($)',
-                    title_font=dict(size=12, color=COLORS['text_primary']),
-                    tickfont=dict(size=10, color=COLORS['text_secondary']),
-                    tickformat='$,.0f',
-                    len=0.8,
-                    y=0.5,
-                    yanchor='middle'
-                ),
-                margin=dict(l=80, r=120, t=100, b=100)
+            # Professional layout plus heatmap overrides, merged once
+            layout = _merge_layout(
+                self._get_professional_layout(title='Annual Salary by Role and City', height=600),
+                {
+                    # Heatmap x values are already the formatted city labels, so the
+                    # categorical axis places ticks by label without explicit tickvals
+                    'xaxis': {'title': {'text': 'City'}, 'tickangle': 45},
+                    'yaxis': {'title': {'text': 'Role'}},
+                    # Fix color bar label and improve layout
+                    'coloraxis': {
+                        'colorbar': dict(
+                            title=dict(
+                                text='Annual Salary ($)',
+                                font=dict(size=12, color=COLORS['text_primary'])
+                            ),
+                            tickfont=dict(size=10, color=COLORS['text_secondary']),
+                            tickformat='$,.0f',
+                            len=0.8,
+                            y=0.5,
+                            yanchor='middle'
+                        )
+                    },
+                    'margin': dict(l=80, r=120, t=100, b=100)
+                }
             )
             
-            return fig
+            return go.Figure(dict(data=traces, layout=layout))
             
         except Exception as e:
             # Create a fallback chart if pivot fails
@@ -934,9 +1032,6 @@ class DashboardVisualizations:
         Returns:
             Plotly figure object
         """
-        # Create standalone chart for degree cost vs salaries
-        fig = go.Figure()
-        
         # Get scenarios with validation
         scenarios = roi_data.get('scenarios', {})
         total_degree_cost = roi_data.get('total_degree_cost', 0)
@@ -944,19 +1039,7 @@ class DashboardVisualizations:
         # Validate data
         if not scenarios or total_degree_cost == 0:
             # Handle empty data case
-            fig.add_annotation(
-                text="No ROI data available for the selected filters",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=16, color=COLORS['text_muted'])
-            )
-            fig.update_layout(
-                title='No Data Available',
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-                plot_bgcolor='rgba(0,0,0,0)'  # Transparent plot background
-            )
-            return fig
+            return self._no_data_figure("No ROI data available for the selected filters")
         
         # Scenario comparison bar chart
         scenario_names = list(scenarios.keys())
@@ -964,98 +1047,51 @@ class DashboardVisualizations:
         
         # Create proper labels for the bar chart with premium styling
         bar_labels = ['Degree Cost'] + [name.title() for name in scenario_names]
-        bar_values = [total_degree_cost] + scenario_salaries
-        bar_colors = [COLORS['error']] + CHART_COLORS[:len(scenario_names)]
-        
-        # Add individual traces for each scenario to enable legend control
-        # Degree Cost bar
-        fig.add_trace(
-            go.Bar(
-                x=['Degree Cost'],
-                y=[total_degree_cost],
-                name='Degree Cost',
+        bar_values = np.asarray([total_degree_cost] + scenario_salaries, dtype=np.float64)
+        bar_colors = [COLORS['error']] + [
+            CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(scenario_names))
+        ]
+        value_kinds = ['Amount'] + ['Salary'] * len(scenario_names)
+        
+        # One trace with per-bar colors; the x labels identify each bar
+        traces = [
+            dict(
+                type='bar',
+                x=bar_labels,
+                y=bar_values,
+                name='Degree Cost vs Salaries',
                 marker=dict(
-                    color=COLORS['error'],
+                    color=bar_colors,
                     line=dict(color=COLORS['background'], width=1),
                     opacity=0.8
                 ),
-                text=[f'${total_degree_cost:,.0f}'],
+                texttemplate='$%{y:,.0f}',
                 textposition='auto',
                 textfont=dict(color=COLORS['text_primary'], size=11),
-                showlegend=True,
-                hovertemplate='<b>Degree Cost</b><br>' +
-                             'Amount: $%{y:,.0f}<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=COLORS['error'],
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-            )
-        )
-        
-        # Add individual bars for each salary scenario
-        for i, (scenario_name, salary) in enumerate(zip(scenario_names, scenario_salaries)):
-            color = CHART_COLORS[i % len(CHART_COLORS)]
-            fig.add_trace(
-                go.Bar(
-                    x=[scenario_name.title()],
-                    y=[salary],
-                    name=f'{scenario_name.title()} Salary',
-                    marker=dict(
-                        color=color,
-                        line=dict(color=COLORS['background'], width=1),
-                        opacity=0.8
-                    ),
-                    text=[f'${salary:,.0f}'],
-                    textposition='auto',
-                    textfont=dict(color=COLORS['text_primary'], size=11),
-                    showlegend=True,
-                    hovertemplate=f'<b>{scenario_name.title()}</b><br>' +
-                                 'Salary: $%{y:,.0f}<extra></extra>',
-                    hoverlabel=dict(
-                        bgcolor='rgba(0,0,0,0)',  # Transparent background
-                        bordercolor=color,
-                        font=dict(color=COLORS['text_primary'], size=12)
-                    )
-                )
+                customdata=value_kinds,
+                showlegend=False,
+                hovertemplate='<b>%{x}</b><br>' +
+                             '%{customdata}: $%{y:,.0f}<extra></extra>',
+                hoverlabel=dict(bordercolor=bar_colors)
             )
-             
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Degree Cost vs Target Salaries',
-            height=500
-        )
+        ]
         
-        # Update axes for standalone chart
-        fig.update_xaxes(title_text="Scenarios")
-        fig.update_yaxes(title_text="Amount ($)", tickformat='$,.0f')
-        
-        # Enhanced legend configuration - positioned outside chart area
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend outside chart area to prevent overlap
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10
-                ),
-                itemsizing='constant',
-                itemwidth=30
+        # Professional layout plus chart-specific overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Degree Cost vs Target Salaries',
+                height=500
             ),
-            # Increase right margin to accommodate the legend
-            margin=dict(l=80, r=120, t=100, b=100)
+            {
+                'xaxis': {'title': {'text': "Scenarios"}},
+                'yaxis': {'title': {'text': "Amount ($)"}, 'tickformat': '$,.0f'},
+                # Single-trace chart: bars are labelled on the x-axis, no legend needed
+                'showlegend': False,
+                'margin': dict(l=80, r=50, t=100, b=100)
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_break_even_timeline_chart(self, roi_data: Dict) -> go.Figure:
         """
@@ -1067,218 +1103,159 @@ class DashboardVisualizations:
         Returns:
             Plotly figure object
         """
-        # Create standalone chart for break-even timeline
-        fig = go.Figure()
-        
         # Get scenarios
         scenarios = roi_data.get('scenarios', {})
+        if 'realistic' not in scenarios:
+            return self._no_data_figure("No ROI data available for the selected filters")
+        
         total_degree_cost = roi_data['total_degree_cost']
-        extended_months = 25  # Default value for x-axis range
-        cumulative_savings = []  # Default empty list for y-axis range calculation
+        traces, shapes, annotations = [], [], []
         
         # Break-even timeline for realistic scenario
-        if 'realistic' in scenarios:
-            realistic = scenarios['realistic']
-            job_search_months = realistic['job_search_months']
-            break_even_months = realistic['break_even_months']
-            total_months = job_search_months + break_even_months
-            
-            # Extend timeline beyond break-even to show positive savings
-            extended_months = int(total_months + 6)  # Add 6 more months to show positive trend
-            extended_months = max(extended_months, 30)  # Ensure minimum 30 months for better visualization
-            
-            # Create timeline data
-            months = list(range(extended_months + 1))
-            cumulative_savings = []
-            
-            for month in months:
-                if month <= job_search_months:
-                    # During job search: no income, accumulating debt
-                    cumulative_savings.append(-total_degree_cost)
-                else:
-                    # After job: earning and saving
-                    working_months = month - job_search_months
-                    savings = realistic['monthly_savings'] * working_months
-                    cumulative_savings.append(savings - total_degree_cost)
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=months,
-                    y=cumulative_savings,
-                    mode='lines+markers',
-                    name='Realistic Break-even Timeline',
-                    line=dict(color=COLORS['primary'], width=4, shape='spline'),
+        realistic = scenarios['realistic']
+        job_search_months = realistic['job_search_months']
+        break_even_months = realistic['break_even_months']
+        total_months = job_search_months + break_even_months
+        
+        # Extend timeline beyond break-even to show positive savings
+        extended_months = int(total_months + 6)  # Add 6 more months to show positive trend
+        extended_months = max(extended_months, 30)  # Ensure minimum 30 months for better visualization
+        
+        # Create timeline data: no savings during the job search, then
+        # monthly savings accumulate against the degree cost
+        months = np.arange(extended_months + 1, dtype=np.int32)
+        working_months = np.maximum(months - job_search_months, 0)
+        cumulative_savings = working_months * realistic['monthly_savings'] - total_degree_cost
+        
+        traces.append(
+            dict(
+                type='scatter',
+                x=months,
+                y=cumulative_savings,
+                mode='lines+markers',
+                name='Realistic Break-even Timeline',
+                line=dict(color=COLORS['primary'], width=4, shape='spline'),
+                marker=dict(
+                    size=10, 
+                    color=COLORS['primary'],
+                    line=dict(color=COLORS['background'], width=2)
+                ),
+                showlegend=True,
+                hovertemplate='<b>Month %{x}</b><br>' +
+                             'Cumulative: $%{y:,.0f}<extra></extra>'
+            )
+        )
+        
+        # Find the actual break-even point: with non-negative savings the
+        # series is flat during the job search and then non-decreasing,
+        # so a binary search finds the first month at or above zero. With
+        # negative savings the series never rises, so only month 0 can qualify
+        if realistic['monthly_savings'] >= 0:
+            first_positive = int(np.searchsorted(cumulative_savings, 0, side='left'))
+            break_even_month = first_positive if first_positive < len(cumulative_savings) else None
+        else:
+            break_even_month = 0 if cumulative_savings[0] >= 0 else None
+        
+        # Break-even line (horizontal line at $0) and job search period indicator
+        shapes.append(dict(
+            type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+            line=dict(dash='dash', color=COLORS['text_primary'])
+        ))
+        shapes.append(dict(
+            type='line', xref='x', x0=job_search_months, x1=job_search_months,
+            yref='y domain', y0=0, y1=1,
+            line=dict(dash='dot', color=COLORS['warning'])
+        ))
+        
+        # Job search annotation - styled like Timeline chart
+        annotations.append(self._get_arrow_annotation_config(
+            job_search_months, 0, "Job Search Ends", COLORS['warning'], WARNING_RGBA_095
+        ))
+        
+        if break_even_month is not None:
+            # Add a marker at the break-even point
+            traces.append(
+                dict(
+                    type='scatter',
+                    x=[break_even_month],
+                    y=[0],
+                    mode='markers',
+                    name='Break-even Point',
                     marker=dict(
-                        size=10, 
-                        color=COLORS['primary'],
-                        line=dict(color=COLORS['background'], width=2)
+                        size=15,
+                        color=COLORS['success'],
+                        symbol='star',
+                        line=dict(color='white', width=2)
                     ),
-                    showlegend=True,
-                    hovertemplate='<b>Month %{x}</b><br>' +
-                                 'Cumulative: $%{y:,.0f}<extra></extra>',
-                    hoverlabel=dict(
-                        bgcolor='rgba(0,0,0,0)',  # Transparent background
-                        bordercolor=COLORS['primary'],
-                        font=dict(color=COLORS['text_primary'], size=12)
-                    )
+                    showlegend=False
                 )
             )
             
-            # Add break-even line (horizontal line at $0)
-            fig.add_hline(y=0, line_dash="dash", line_color=COLORS['text_primary'])
-            
-            # Add job search period indicator
-            fig.add_vline(x=job_search_months, line_dash="dot", line_color=COLORS['warning'])
+            # Break-even point annotation - styled like Timeline chart
+            annotations.append(self._get_arrow_annotation_config(
+                break_even_month, 0, "Break-even Point", COLORS['success'], SUCCESS_RGBA_095
+            ))
             
-            # Add job search annotation - styled like Timeline chart
-            fig.add_annotation(
-                x=job_search_months,
-                y=0,
-                xref="x",
-                yref="y",
-                text="Job Search Ends",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                arrowcolor=COLORS['warning'],
-                font=dict(
-                    size=12, 
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif'
-                ),
-                bgcolor=f'rgba({int(COLORS["warning"][1:3], 16)}, {int(COLORS["warning"][3:5], 16)}, {int(COLORS["warning"][5:7], 16)}, 0.95)',
-                bordercolor=COLORS['warning'],
-                borderwidth=2,
-                align='center',
-                xanchor='center',
-                yanchor='bottom'
-            )
+            # Add positive trend annotation
+            if break_even_month < extended_months - 5:
+                positive_month = break_even_month + 3
+                positive_savings = float(cumulative_savings[min(positive_month, len(cumulative_savings) - 1)])
+                if positive_savings > 0:
+                    annotations.append(self._get_arrow_annotation_config(
+                        positive_month, positive_savings, "Positive Savings Trend",
+                        COLORS['success'], SUCCESS_RGBA_095
+                    ))
         
-            # Find and mark the actual break-even point
-            break_even_month = None
-            for i, savings in enumerate(cumulative_savings):
-                if savings >= 0:
-                    break_even_month = i
-                    break
-            
-            if break_even_month is not None:
-                # Add break-even point annotation - styled like Timeline chart
-                fig.add_annotation(
-                    x=break_even_month,
-                    y=0,
-                    xref="x",
-                    yref="y",
-                    text="Break-even Point",
-                    showarrow=True,
-                    arrowhead=2,
-                    arrowsize=1,
-                    arrowwidth=2,
-                    arrowcolor=COLORS['success'],
+        # Calculate y-axis range for better visualization
+        y_min = float(cumulative_savings.min()) - 5000  # Add buffer below minimum
+        y_max = float(cumulative_savings.max()) + 5000   # Add buffer above maximum
+        yaxis = {
+            'title': {'text': "Cumulative Savings ($)"},
+            'tickformat': '$,.0f',
+            'range': [y_min, y_max]
+        }
+        
+        # Professional layout plus chart-specific overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Break-even Timeline',
+                height=500
+            ),
+            {
+                'xaxis': {
+                    'title': {'text': "Months"},
+                    'range': [0, extended_months],
+                    'gridcolor': 'rgba(0,0,0,0.1)',
+                    'showgrid': True
+                },
+                'yaxis': yaxis,
+                'shapes': shapes,
+                'annotations': annotations,
+                # Enhanced legend configuration - positioned outside chart area
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,  # Move legend outside chart area to prevent overlap
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
                     font=dict(
-                        size=12, 
                         color=COLORS['text_primary'],
-                        family='Inter, sans-serif'
+                        family='Inter, sans-serif',
+                        size=10
                     ),
-                    bgcolor=f'rgba({int(COLORS["success"][1:3], 16)}, {int(COLORS["success"][3:5], 16)}, {int(COLORS["success"][5:7], 16)}, 0.95)',
-                    bordercolor=COLORS['success'],
-                    borderwidth=2,
-                    align='center',
-                    xanchor='center',
-                    yanchor='bottom'
-                )
-                
-                # Add a marker at the break-even point
-                fig.add_trace(
-                    go.Scatter(
-                        x=[break_even_month],
-                        y=[0],
-                        mode='markers',
-                        name='Break-even Point',
-                        marker=dict(
-                            size=15,
-                            color=COLORS['success'],
-                            symbol='star',
-                            line=dict(color='white', width=2)
-                        ),
-                        showlegend=False
-                    )
-                )
-                
-                # Add positive trend annotation
-                if break_even_month < extended_months - 5:
-                    positive_month = break_even_month + 3
-                    positive_savings = cumulative_savings[min(positive_month, len(cumulative_savings) - 1)]
-                    if positive_savings > 0:
-                        fig.add_annotation(
-                            x=positive_month,
-                            y=positive_savings,
-                            xref="x",
-                            yref="y",
-                            text="Positive Savings Trend",
-                            showarrow=True,
-                            arrowhead=2,
-                            arrowsize=1,
-                            arrowwidth=2,
-                            arrowcolor=COLORS['success'],
-                            font=dict(
-                                size=12, 
-                                color=COLORS['text_primary'],
-                                family='Inter, sans-serif'
-                            ),
-                            bgcolor=f'rgba({int(COLORS["success"][1:3], 16)}, {int(COLORS["success"][3:5], 16)}, {int(COLORS["success"][5:7], 16)}, 0.95)',
-                            bordercolor=COLORS['success'],
-                            borderwidth=2,
-                            align='center',
-                            xanchor='center',
-                            yanchor='bottom'
-                        )
-        
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Break-even Timeline',
-            height=500
-        )
-        
-        # Update axes for standalone chart
-        fig.update_xaxes(title_text="Months", range=[0, extended_months], 
-                        gridcolor='rgba(0,0,0,0.1)', showgrid=True)
-        
-        # Calculate y-axis range for better visualization
-        if 'realistic' in scenarios and cumulative_savings:
-            y_min = min(cumulative_savings) - 5000  # Add buffer below minimum
-            y_max = max(cumulative_savings) + 5000   # Add buffer above maximum
-            fig.update_yaxes(title_text="Cumulative Savings ($)", 
-                           tickformat='$,.0f', range=[y_min, y_max])
-        else:
-            fig.update_yaxes(title_text="Cumulative Savings ($)", tickformat='$,.0f')
-        
-        # Enhanced legend configuration - positioned outside chart area
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend outside chart area to prevent overlap
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10
+                    itemsizing='constant',
+                    itemwidth=30
                 ),
-                itemsizing='constant',
-                itemwidth=30
-            ),
-            # Increase right margin to accommodate the legend
-            margin=dict(l=80, r=120, t=100, b=100)
+                # Increase right margin to accommodate the legend
+                'margin': dict(l=80, r=120, t=100, b=100)
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_anomaly_detection_chart(self, expenses_data: pd.DataFrame, 
                                      anomalies: pd.DataFrame) -> go.Figure:
@@ -1292,12 +1269,20 @@ class DashboardVisualizations:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
-        
-        # Add all expenses as scatter points with premium styling
-        fig.add_trace(go.Scatter(
-            x=expenses_data['Date'],
-            y=expenses_data['Amount'],
+        # Columns as NumPy views: traces serialize them as whole buffers.
+        # The int64 view below is only meaningful for datetime64 columns.
+        date_series = expenses_data['Date']
+        if date_series.dtype.kind != 'M':
+            date_series = pd.to_datetime(date_series)
+        dates = date_series.to_numpy()
+        amounts = expenses_data['Amount'].to_numpy()
+        
+        # Add all expenses as scatter points with premium styling; large
+        # histories use WebGL, anomalies and trend stay SVG on top
+        traces = [dict(
+            type='scattergl' if len(dates) > WEBGL_MIN_POINTS else 'scatter',
+            x=dates,
+            y=amounts,
             mode='markers',
             name='All Expenses',
             marker=dict(
@@ -1307,133 +1292,113 @@ class DashboardVisualizations:
                 line=dict(color=COLORS['background'], width=1)
             ),
             hovertemplate='<b>%{x}</b><br>' +
-                         'Amount: $%{y:,.0f}<extra></extra>',
-            hoverlabel=dict(
-                bgcolor='rgba(0,0,0,0)',  # Transparent background
-                bordercolor=COLORS['primary'],
-                font=dict(color=COLORS['text_primary'], size=12)
-            )
-        ))
+                         'Amount: $%{y:,.0f}<extra></extra>'
+        )]
         
         # Add anomalies as highlighted points with premium styling
         if not anomalies.empty:
-            fig.add_trace(go.Scatter(
-            x=anomalies['Date'],
-            y=anomalies['Amount'],
-            mode='markers',
-            name='Anomalies',
-            marker=dict(
-                color=COLORS['warning'],
-                size=16,
-                symbol='diamond',
-                line=dict(color=COLORS['background'], width=2)
+            traces.append(dict(
+                type='scatter',
+                x=anomalies['Date'].to_numpy(),
+                y=anomalies['Amount'].to_numpy(),
+                mode='markers',
+                name='Anomalies',
+                marker=dict(
+                    color=COLORS['warning'],
+                    size=16,
+                    symbol='diamond',
+                    line=dict(color=COLORS['background'], width=2)
                 ),
                 hovertemplate='<b>%{x}</b><br>' +
                              'Amount: $%{y:,.0f}<br>' +
                              'ANOMALY<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=COLORS['warning'],
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-        ))
-        
-        # Add trend line with premium styling
-        z = np.polyfit(expenses_data['Date'].astype(np.int64), expenses_data['Amount'], 1)
-        p = np.poly1d(z)
+                hoverlabel=dict(bordercolor=COLORS['warning'])
+            ))
         
-        fig.add_trace(go.Scatter(
-            x=expenses_data['Date'],
-            y=p(expenses_data['Date'].astype(np.int64)),
+        # Add trend line with premium styling; closed-form least-squares fit
+        # on the centered int64 view of the dates
+        x_centered = date_series.array.asi8.astype(np.float64)
+        x_centered -= x_centered.mean()
+        mean_amount = amounts.mean()
+        x_var = np.dot(x_centered, x_centered)
+        slope = np.dot(x_centered, amounts - mean_amount) / x_var if x_var else 0.0
+        trend_y = slope * x_centered + mean_amount
+        
+        traces.append(dict(
+            type='scatter',
+            x=dates,
+            y=trend_y,
             mode='lines',
             name='Trend Line',
             line=dict(color=COLORS['accent2'], width=3, dash='dash', shape='spline'),
             hovertemplate='<b>Trend Line</b><br>' +
                          'Amount: $%{y:,.0f}<extra></extra>',
-            hoverlabel=dict(
-                bgcolor='rgba(0,0,0,0)',  # Transparent background
-                bordercolor=COLORS['accent2'],
-                font=dict(color=COLORS['text_primary'], size=12)
-            )
+            hoverlabel=dict(bordercolor=COLORS['accent2'])
         ))
         
-        # Add statistical bands
-        mean_amount = expenses_data['Amount'].mean()
-        std_amount = expenses_data['Amount'].std()
+        # Add statistical bands (sample std, matching pandas' ddof=1)
+        std_amount = amounts.std(ddof=1)
         
         # Upper and lower bounds with premium styling
         upper_bound = mean_amount + 2 * std_amount
         lower_bound = mean_amount - 2 * std_amount
         
-        fig.add_hline(
-            y=upper_bound, 
-            line_dash="dot", 
-            line_color=COLORS['warning'],
-            line_width=2,
-            annotation=dict(
-                text="Upper Bound (2σ)",
-                font=dict(
-                    color=COLORS['warning'],
-                    size=10,
-                    family='Inter, sans-serif'
-                ),
-                bgcolor=f'rgba({int(COLORS["surface"][1:3], 16)}, {int(COLORS["surface"][3:5], 16)}, {int(COLORS["surface"][5:7], 16)}, 0.9)',
-                bordercolor=COLORS['warning']
-            )
-        )
-        fig.add_hline(
-            y=lower_bound, 
-            line_dash="dot", 
-            line_color=COLORS['warning'],
-            line_width=2,
-            annotation=dict(
-                text="Lower Bound (2σ)",
+        shapes, annotations = [], []
+        for bound, label in ((upper_bound, "Upper Bound (2σ)"), (lower_bound, "Lower Bound (2σ)")):
+            shapes.append(dict(
+                type='line', xref='x domain', x0=0, x1=1, yref='y', y0=bound, y1=bound,
+                line=dict(dash='dot', color=COLORS['warning'], width=2)
+            ))
+            annotations.append(dict(
+                text=label,
+                xref='x domain', x=1, xanchor='right',
+                yref='y', y=bound, yanchor='bottom',
+                showarrow=False,
                 font=dict(
                     color=COLORS['warning'],
                     size=10,
                     family='Inter, sans-serif'
                 ),
-                bgcolor=f'rgba({int(COLORS["surface"][1:3], 16)}, {int(COLORS["surface"][3:5], 16)}, {int(COLORS["surface"][5:7], 16)}, 0.9)',
+                bgcolor=SURFACE_RGBA_090,
                 bordercolor=COLORS['warning']
-            )
-        )
-        
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Anomaly Detection in Expenses with Statistical Bands',
-            height=500
-        )
+            ))
         
-        # Update axes
-        fig.update_xaxes(title='Date')
-        fig.update_yaxes(title='Amount ($)', tickformat='$,.0f')
-        
-        # Enhanced legend configuration - positioned outside chart area
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend outside chart area to prevent overlap
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10
-                ),
-                itemsizing='constant',
-                itemwidth=30
+        # Professional layout plus chart-specific overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Anomaly Detection in Expenses with Statistical Bands',
+                height=500
             ),
-            # Increase right margin to accommodate the legend
-            margin=dict(l=80, r=120, t=100, b=100)
+            {
+                'xaxis': {'title': {'text': 'Date'}},
+                'yaxis': {'title': {'text': 'Amount ($)'}, 'tickformat': '$,.0f'},
+                'shapes': shapes,
+                'annotations': annotations,
+                # Enhanced legend configuration - positioned outside chart area
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,  # Move legend outside chart area to prevent overlap
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
+                    font=dict(
+                        color=COLORS['text_primary'],
+                        family='Inter, sans-serif',
+                        size=10
+                    ),
+                    itemsizing='constant',
+                    itemwidth=30
+                ),
+                # Increase right margin to accommodate the legend
+                'margin': dict(l=80, r=120, t=100, b=100)
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_payment_pie_chart(self, expenses_data: pd.DataFrame) -> go.Figure:
         """
@@ -1446,18 +1411,22 @@ class DashboardVisualizations:
             Plotly figure object
         """
         # Group by payment type and sum amounts
-        payment_summary = expenses_data.groupby('PaymentType')['Amount'].sum().reset_index()
+        payment_summary = expenses_data.groupby('PaymentType')['Amount'].sum()
+        payment_types = payment_summary.index.to_numpy()
+        payment_amounts = payment_summary.to_numpy()
+        slice_colors = [CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(payment_types))]
         
         # Create pie chart with premium styling
-        fig = go.Figure(data=[go.Pie(
-            labels=[self._format_label_for_display(ptype) for ptype in payment_summary['PaymentType']],
-            values=payment_summary['Amount'],
+        traces = [dict(
+            type='pie',
+            labels=[self._format_label_for_display(ptype) for ptype in payment_types],
+            values=payment_amounts,
             hole=0.4,
             textinfo='percent',
             textposition='inside',
             insidetextorientation='radial',
             marker=dict(
-                colors=[CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(payment_summary))],
+                colors=slice_colors,
                 line=dict(color=COLORS['background'], width=2)
             ),
             textfont=dict(
@@ -1467,42 +1436,36 @@ class DashboardVisualizations:
             ),
             hovertemplate='<b>%{label}</b><br>' +
                          'Amount: $%{value:,.0f}<br>' +
-                         'Percentage: %{percent:.1%}<extra></extra>',
-            hoverlabel=dict(
-                bgcolor='rgba(0,0,0,0)',  # Transparent background
-                bordercolor=COLORS['primary'],
-                font=dict(color=COLORS['text_primary'], size=12)
-            )
-        )])
-        
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Expense Distribution by Payment Type',
-            height=400
-        )
-        
-        # Update layout for better pie chart display with premium styling
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=11
+                         'Percentage: %{percent:.1%}<extra></extra>'
+        )]
+        
+        # Professional layout plus pie-specific legend styling, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Expense Distribution by Payment Type',
+                height=400
+            ),
+            {
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
+                    font=dict(
+                        color=COLORS['text_primary'],
+                        family='Inter, sans-serif',
+                        size=11
+                    )
                 )
-            )
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
     
     def create_timeline_chart(self, milestones: List[Dict]) -> go.Figure:
         """
@@ -1514,57 +1477,29 @@ class DashboardVisualizations:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
+        # Split the milestone records into per-field columns in one pass each
+        dates = [milestone['date'] for milestone in milestones]
+        labels = [milestone.get('event', '') for milestone in milestones]
+        types = [milestone.get('type', 'general') for milestone in milestones]
+        impacts = [milestone.get('impact', 'N/A') for milestone in milestones]
+        financials = [milestone.get('financial_implication', 'N/A') for milestone in milestones]
+        
+        # Color coding and symbol based on milestone type
+        styles = [MILESTONE_TYPE_STYLES.get(t, DEFAULT_MILESTONE_STYLE) for t in types]
+        colors = [color for color, _ in styles]
+        symbols = [symbol for _, symbol in styles]
+        
+        hover_data = list(zip(
+            [self._format_label_for_display(label) for label in labels],
+            [self._format_label_for_display(t) for t in types],
+            impacts,
+            financials
+        ))
         
-        # Create timeline visualization
-        for i, milestone in enumerate(milestones):
-            label = milestone.get('event', '')
-            milestone_type = milestone.get('type', 'general')
-            
-            # Color coding based on milestone type
-            if milestone_type == 'academic':
-                color = COLORS['primary']
-                symbol = 'diamond'
-            elif milestone_type == 'employment':
-                color = COLORS['success']
-                symbol = 'star'
-            elif milestone_type == 'personal':
-                color = COLORS['accent1']
-                symbol = 'circle'
-            elif milestone_type == 'financial':
-                color = COLORS['warning']
-                symbol = 'square'
-            else:
-                color = COLORS['text_muted']
-                symbol = 'diamond'
-            
-            fig.add_trace(go.Scatter(
-                x=[milestone['date']],
-                y=[i],
-                mode='markers',
-                name=self._format_label_for_display(label),
-                marker=dict(
-                    size=24,
-                    color=color,
-                    symbol=symbol,
-                    line=dict(color=COLORS['background'], width=2)
-                ),
-                showlegend=False,
-                hovertemplate='<b>%{fullData.name}</b><br>' +
-                             '<b>Date:</b> %{x}<br>' +
-                             '<b>Type:</b> ' + self._format_label_for_display(milestone_type) + '<br>' +
-                             '<b>Impact:</b> ' + milestone.get('impact', 'N/A') + '<br>' +
-                             '<b>Financial:</b> ' + milestone.get('financial_implication', 'N/A') + '<extra></extra>',
-                hoverlabel=dict(
-                    bgcolor='rgba(0,0,0,0)',  # Transparent background
-                    bordercolor=color,
-                    font=dict(color=COLORS['text_primary'], size=12)
-                )
-            ))
-            
-            # Add milestone label as annotation positioned beside the symbol (no overlap)
-            fig.add_annotation(
-                x=milestone['date'],
+        # Milestone labels positioned beside the symbols (no overlap)
+        annotations = [
+            dict(
+                x=date,
                 y=i,
                 text=label,
                 showarrow=False,  # Remove arrows completely
@@ -1573,7 +1508,7 @@ class DashboardVisualizations:
                     color=COLORS['text_primary'],
                     family='Inter, sans-serif'
                 ),
-                bgcolor=f'rgba({int(COLORS["surface"][1:3], 16)}, {int(COLORS["surface"][3:5], 16)}, {int(COLORS["surface"][5:7], 16)}, 0.95)',
+                bgcolor=SURFACE_RGBA_095,
                 bordercolor=color,
                 borderwidth=2,
                 align='left',
@@ -1581,50 +1516,74 @@ class DashboardVisualizations:
                 yanchor='middle',
                 xshift=15  # Move label to the right of the symbol to prevent overlap
             )
+            for i, (date, label, color) in enumerate(zip(dates, labels, colors))
+        ]
         
-        # Apply professional layout
-        fig = self._apply_professional_layout(
-            fig,
-            title='Academic Journey Timeline with Impact Analysis',
-            height=500
-        )
-        
-        # Update axes with proper date formatting
-        fig.update_xaxes(
-            title='Date',
-            type='date',
-            tickformat='%b %Y',
-            tickmode='auto',
-            nticks=8,
-            tickangle=45
-        )
-        fig.update_yaxes(title='Milestone', showticklabels=False)
-        
-        # Enhanced legend configuration - positioned outside chart area
-        fig.update_layout(
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # Move legend outside chart area to prevent overlap
-                bgcolor='rgba(0,0,0,0)',
-                bordercolor='rgba(0,0,0,0)',
-                borderwidth=0,
-                font=dict(
-                    color=COLORS['text_primary'],
-                    family='Inter, sans-serif',
-                    size=10
-                ),
-                itemsizing='constant',
-                itemwidth=30
+        traces = [dict(
+            type='scatter',
+            x=dates,
+            y=np.arange(len(milestones)),
+            mode='markers',
+            name='Milestones',
+            marker=dict(
+                size=24,
+                color=colors,
+                symbol=symbols,
+                line=dict(color=COLORS['background'], width=2)
             ),
-            # Increase right margin to accommodate the legend
-            margin=dict(l=80, r=120, t=100, b=100)
+            customdata=hover_data,
+            showlegend=False,
+            hovertemplate='<b>%{customdata[0]}</b><br>' +
+                         '<b>Date:</b> %{x}<br>' +
+                         '<b>Type:</b> %{customdata[1]}<br>' +
+                         '<b>Impact:</b> %{customdata[2]}<br>' +
+                         '<b>Financial:</b> %{customdata[3]}<extra></extra>',
+            hoverlabel=dict(bordercolor=colors)
+        )]
+        
+        # Professional layout plus chart-specific overrides, merged once
+        layout = _merge_layout(
+            self._get_professional_layout(
+                title='Academic Journey Timeline with Impact Analysis',
+                height=500
+            ),
+            {
+                # Axes with proper date formatting
+                'xaxis': {
+                    'title': {'text': 'Date'},
+                    'type': 'date',
+                    'tickformat': '%b %Y',
+                    'tickmode': 'auto',
+                    'nticks': 8,
+                    'tickangle': 45
+                },
+                'yaxis': {'title': {'text': 'Milestone'}, 'showticklabels': False},
+                'annotations': annotations,
+                # Enhanced legend configuration - positioned outside chart area
+                'showlegend': True,
+                'legend': dict(
+                    orientation="v",
+                    yanchor="top",
+                    y=0.95,
+                    xanchor="left",
+                    x=1.02,  # Move legend outside chart area to prevent overlap
+                    bgcolor='rgba(0,0,0,0)',
+                    bordercolor='rgba(0,0,0,0)',
+                    borderwidth=0,
+                    font=dict(
+                        color=COLORS['text_primary'],
+                        family='Inter, sans-serif',
+                        size=10
+                    ),
+                    itemsizing='constant',
+                    itemwidth=30
+                ),
+                # Increase right margin to accommodate the legend
+                'margin': dict(l=80, r=120, t=100, b=100)
+            }
         )
         
-        return fig
+        return go.Figure(dict(data=traces, layout=layout))
 
 
 def main():